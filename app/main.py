@@ -121,7 +121,8 @@ async def log_requests(request: Request, call_next: Callable):
     start_time = time.time()
     request.state.start_time = start_time
     
-    request_id = getattr(request.state, 'request_id', str(uuid.uuid4()))
+    # RequestLogger generates an id itself when the request has none
+    request_id = getattr(request.state, 'request_id', None)
     
     with RequestLogger(f"{request.method} {request.url.path}", request_id) as req_log:
         try:
@@ -1,6 +1,7 @@
 """Calendar router for monthly and daily panchanga."""
 
-from datetime import datetime, timedelta
+import zoneinfo
+from datetime import date, datetime, time, timedelta
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query
@@ -14,6 +15,13 @@ logger = get_logger("calendar")
 
 router = APIRouter(prefix="/v1/calendar", tags=["calendar"])
 
+# Local time of day used for each non-custom anchor
+ANCHOR_TIMES = {
+    "sunrise": time(6, 0),
+    "midnight": time(0, 0),
+    "noon": time(12, 0)
+}
+
 
 @router.get("/month")
 async def get_monthly_calendar(
@@ -52,29 +60,33 @@ async def get_monthly_calendar(
             else:
                 end_date = datetime(year, month + 1, 1) - timedelta(days=1)
             
+            # Resolve time zones once for the whole month
+            tz = zoneinfo.ZoneInfo(place_info["timezone"]["timeZoneId"])
+            utc = zoneinfo.ZoneInfo("UTC")
+            
+            # Resolve the anchor time of day once for the whole month
+            if anchor == "custom":
+                hour, minute = map(int, custom_time.split(":"))
+                anchor_time = time(hour, minute)
+            else:
+                # Simplified sunrise calculation (6 AM local)
+                anchor_time = ANCHOR_TIMES.get(anchor, time())
+            
+            # Output options are fixed for the whole month
+            include_dms = units in ("dms", "both")
+            detailed = format == "detailed"
+            
             days = []
-            current_date = start_date
+            first_day = start_date.toordinal()
+            n_days = (end_date - start_date).days + 1
             
-            while current_date <= end_date:
+            for ordinal in range(first_day, first_day + n_days):
                 # Calculate anchor time for the day
-                anchor_dt = current_date
-                
-                if anchor == "sunrise":
-                    # Simplified sunrise calculation (6 AM local)
-                    anchor_dt = current_date.replace(hour=6, minute=0, second=0, microsecond=0)
-                elif anchor == "midnight":
-                    anchor_dt = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                elif anchor == "noon":
-                    anchor_dt = current_date.replace(hour=12, minute=0, second=0, microsecond=0)
-                elif anchor == "custom":
-                    hour, minute = map(int, custom_time.split(":"))
-                    anchor_dt = current_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                current_date = date.fromordinal(ordinal)
+                anchor_dt = datetime.combine(current_date, anchor_time, tzinfo=tz)
                 
                 # Convert to UTC
-                import zoneinfo
-                tz = zoneinfo.ZoneInfo(place_info["timezone"]["timeZoneId"])
-                anchor_dt = anchor_dt.replace(tzinfo=tz)
-                anchor_utc = anchor_dt.astimezone(zoneinfo.ZoneInfo("UTC"))
+                anchor_utc = anchor_dt.astimezone(utc)
                 
                 # Calculate planetary positions
                 planet_data = swe_service.calculate_planets(anchor_utc, planet_list)
@@ -100,24 +112,23 @@ async def get_monthly_calendar(
                         "changedRasi": False
                     }
                     
-                    if units in ["dms", "both"]:
+                    if include_dms:
                         # formatted_planet["lon_dms"] = panchanga_service.to_dms(data["longitude"])  # TEMPORARILY DISABLED
                         formatted_planet["lon_dms"] = f"{data['longitude']:.2f}°"
                     
                     formatted_planets[planet] = formatted_planet
                 
                 day_data = {
-                    "date": current_date.date().isoformat(),
+                    "date": current_date.isoformat(),
                     "anchor_ts_local": anchor_dt.isoformat(),
                     "planets": formatted_planets
                 }
                 
-                if format == "detailed":
+                if detailed:
                     # TODO: implement detailed events
                     day_data["events"] = []
                 
                 days.append(day_data)
-                current_date += timedelta(days=1)
             
             return {
                 "year": year,
@@ -3,10 +3,12 @@
 from datetime import datetime
 from typing import Optional
 
+import swisseph as swe
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from app.services.panchanga_precise import precise_panchanga_service
+from app.services.sunrise_precise import precise_sunrise_service
 from app.services.swe import swe_service
 from app.util.logging import get_logger, RequestLogger
 
@@ -37,7 +39,6 @@ async def get_ayanamsa_info(
             dt = datetime.fromisoformat(dt_str)
             
             # Get ayanamsa value using Swiss Ephemeris
-            import swisseph as swe
             jd = swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
             
             # Get ayanamsa value (True Citra Paksha is already set in swe_service)
@@ -163,7 +164,6 @@ async def get_sunrise_time(
                 raise HTTPException(status_code=400, detail="Longitude must be between -180 and 180")
             
             # Get sunrise time
-            from app.services.sunrise_precise import precise_sunrise_service
             sunrise_time = precise_sunrise_service.calculate_sunrise(dt, latitude, longitude, altitude)
             
             return {
@@ -202,7 +202,6 @@ async def get_sunset_time(
                 raise HTTPException(status_code=400, detail="Longitude must be between -180 and 180")
             
             # Get sunset time
-            from app.services.sunrise_precise import precise_sunrise_service
             sunset_time = precise_sunrise_service.calculate_sunset(dt, latitude, longitude, altitude)
             
             return {
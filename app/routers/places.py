@@ -2,6 +2,7 @@
 
 import os
 import time
+from collections import OrderedDict
 from typing import Optional, List, Dict
 import httpx
 
@@ -15,6 +16,12 @@ logger = get_logger("places")
 
 router = APIRouter(prefix="/v1/places", tags=["places"])
 
+# Most entries kept in the place details cache; the least recently used one is evicted first
+PLACE_DETAILS_CACHE_SIZE = 4096
+
+# Resolved place details keyed by (place_id, language, fields), with the time they were fetched
+_details_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
 
 class PlaceAutocompleteResponse(BaseModel):
     """Response model for place autocomplete."""
@@ -149,6 +156,18 @@ async def place_details(
                     timezone={"timeZoneId": "UTC"}
                 )
             
+            # Serve repeated lookups from cache; requests carrying a session token
+            # always go to Google so the autocomplete billing session is closed,
+            # and their responses are not cached
+            cache_key = (place_id, language, fields)
+            if not sessiontoken and cache_key in _details_cache:
+                cached_details, cached_time = _details_cache[cache_key]
+                if time.time() - cached_time < settings.place_cache_ttl:
+                    _details_cache.move_to_end(cache_key)
+                    req_log.success()
+                    return cached_details
+                del _details_cache[cache_key]
+            
             # Build Google Places API URL
             base_url = f"https://maps.googleapis.com/maps/api/place/details/json"
             params = {
@@ -192,6 +211,11 @@ async def place_details(
                     geometry=result.get("geometry", {}),
                     timezone=timezone_info
                 )
+                if not sessiontoken:
+                    _details_cache[cache_key] = (place_details, time.time())
+                    _details_cache.move_to_end(cache_key)
+                    if len(_details_cache) > PLACE_DETAILS_CACHE_SIZE:
+                        _details_cache.popitem(last=False)
                 
                 req_log.success()
                 return place_details
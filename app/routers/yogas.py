@@ -1,9 +1,10 @@
 """Yogas router for panchanga yoga detection."""
 
+import json
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 
 from app.services.yogas import yogas_service
@@ -13,6 +14,9 @@ logger = get_logger("yogas")
 
 router = APIRouter(prefix="/v1/panchanga/yogas", tags=["yogas"])
 
+# Longest date range accepted by the range endpoint, in days
+MAX_RANGE_DAYS = 366
+
 
 class YogaDetectionRequest(BaseModel):
     """Yoga detection request model."""
@@ -22,6 +26,11 @@ class YogaDetectionRequest(BaseModel):
     altitude: Optional[float] = 0.0
 
 
+def _parse_date(value: str) -> datetime:
+    """Parse an ISO date or date-time string, keeping any time of day and offset."""
+    return datetime.fromisoformat(value)
+
+
 @router.get("/detect")
 async def detect_yogas_get(
     date: str = Query(..., description="Date in YYYY-MM-DD format"),
@@ -34,7 +43,7 @@ async def detect_yogas_get(
         try:
             # Validate date format
             try:
-                dt = datetime.fromisoformat(date)
+                dt = _parse_date(date)
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
             
@@ -44,11 +53,13 @@ async def detect_yogas_get(
             if not (-180 <= longitude <= 180):
                 raise HTTPException(status_code=400, detail="Longitude must be between -180 and 180")
             
-            # Detect yogas using improved service
-            result = yogas_service.detect_yogas(dt, latitude, longitude)
+            # Detect yogas using improved service; the cached payload is already JSON
+            payload = yogas_service.detect_yogas_json(dt, latitude, longitude)
             
-            return result
+            return Response(content=payload, media_type="application/json")
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Yoga detection failed: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -61,7 +72,7 @@ async def detect_yogas_post(request: YogaDetectionRequest):
         try:
             # Validate date format
             try:
-                dt = datetime.fromisoformat(request.date)
+                dt = _parse_date(request.date)
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
             
@@ -71,11 +82,58 @@ async def detect_yogas_post(request: YogaDetectionRequest):
             if not (-180 <= request.longitude <= 180):
                 raise HTTPException(status_code=400, detail="Longitude must be between -180 and 180")
             
-            # Detect yogas using improved service
-            result = yogas_service.detect_yogas(dt, request.latitude, request.longitude)
+            # Detect yogas using improved service; the cached payload is already JSON
+            payload = yogas_service.detect_yogas_json(dt, request.latitude, request.longitude)
             
-            return result
+            return Response(content=payload, media_type="application/json")
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Yoga detection failed: {e}")
             raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/range")
+def detect_yogas_range(
+    start_date: str = Query(..., description="First date in YYYY-MM-DD format"),
+    end_date: str = Query(..., description="Last date (inclusive) in YYYY-MM-DD format"),
+    latitude: float = Query(..., description="Latitude in decimal degrees"),
+    longitude: float = Query(..., description="Longitude in decimal degrees")
+):
+    """Detect panchanga yogas for every day in a date range."""
+    # Declared sync so FastAPI runs up to MAX_RANGE_DAYS of ephemeris work in its threadpool
+    with RequestLogger("yogas.range") as req_log:
+        try:
+            # Validate date format
+            try:
+                start_dt = _parse_date(start_date)
+                end_dt = _parse_date(end_date)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+            
+            n_days = (end_dt.date() - start_dt.date()).days + 1
+            if n_days < 1:
+                raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+            if n_days > MAX_RANGE_DAYS:
+                raise HTTPException(status_code=400, detail=f"Date range must not exceed {MAX_RANGE_DAYS} days")
+            
+            # Validate coordinates
+            if not (-90 <= latitude <= 90):
+                raise HTTPException(status_code=400, detail="Latitude must be between -90 and 90")
+            if not (-180 <= longitude <= 180):
+                raise HTTPException(status_code=400, detail="Longitude must be between -180 and 180")
+            
+            # Days are served from the per-day cache as already serialized JSON
+            days = yogas_service.detect_yogas_range_json(start_dt, end_dt, latitude, longitude)
+            # Serialize the envelope with json, then append the cached days array as its last member
+            envelope = json.dumps({"start_date": start_date, "end_date": end_date})
+            payload = "".join((envelope[:-1], ', "days": ', days, "}"))
+            
+            return Response(content=payload, media_type="application/json")
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Yoga range detection failed: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
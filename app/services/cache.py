@@ -1,8 +1,11 @@
 """Cache service with Redis support."""
 
+import asyncio
+import functools
 import json
 import pickle
-from typing import Any, Optional, Union
+import weakref
+from typing import Any, Dict, Optional, Union
 from datetime import timedelta
 
 import redis.asyncio as redis
@@ -122,19 +125,22 @@ class CacheService:
 cache_service = CacheService()
 
 
+# In-flight computations per event loop, keyed by cache key and shared by concurrent
+# callers on that loop; tasks are never awaited from a loop other than their own
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 # Cache decorator
 def cached(prefix: str, ttl: int = 600):
-    """Cache decorator for functions."""
+    """Cache decorator for functions with single-flight on cache misses.
+    
+    Concurrent callers of the same key on one event loop share a single call and
+    receive the same result object, so callers must not mutate what they get back.
+    """
     def decorator(func):
-        async def wrapper(*args, **kwargs):
-            # Generate cache key
-            key_parts = [prefix] + [str(arg) for arg in args]
-            if kwargs:
-                sorted_kwargs = sorted(kwargs.items())
-                key_parts.extend([f"{k}={v}" for k, v in sorted_kwargs])
-            
-            cache_key = ":".join(key_parts)
-            
+        async def compute(cache_key, args, kwargs):
             # Try to get from cache
             cached_result = await cache_service.get(cache_key)
             if cached_result is not None:
@@ -147,5 +153,26 @@ def cached(prefix: str, ttl: int = 600):
             logger.debug(f"Cache miss for key: {cache_key}")
             
             return result
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Generate cache key
+            key_parts = [prefix] + [str(arg) for arg in args]
+            if kwargs:
+                sorted_kwargs = sorted(kwargs.items())
+                key_parts.extend([f"{k}={v}" for k, v in sorted_kwargs])
+            
+            cache_key = ":".join(key_parts)
+            
+            # Concurrent callers for the same key on this loop await one shared computation
+            loop_inflight = _inflight.setdefault(asyncio.get_running_loop(), {})
+            task = loop_inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(compute(cache_key, args, kwargs))
+                loop_inflight[cache_key] = task
+                task.add_done_callback(lambda _: loop_inflight.pop(cache_key, None))
+            
+            # Shield so a cancelled caller does not cancel the other waiters
+            return await asyncio.shield(task)
         return wrapper
     return decorator
@@ -25,6 +25,10 @@ class NavataraService:
         
         self.nakshatras_28 = self.nakshatras_27 + ["Abhijit"]
         
+        # Name -> index lookups, so get_nakshatra_index does not scan the lists
+        self.nakshatra_index_27 = {name: index for index, name in enumerate(self.nakshatras_27)}
+        self.nakshatra_index_28 = {name: index for index, name in enumerate(self.nakshatras_28)}
+        
         self.group_deities = {
             "Agni": ["Ashwini", "Magha", "Mula"],
             "Vayu": ["Bharani", "Purva Phalguni", "Purva Ashadha"],
@@ -54,14 +58,16 @@ class NavataraService:
             "Kaal": ["Pushya", "Anuradha", "Uttara Bhadrapada"],
             "Maitri": ["Ashlesha", "Jyeshtha", "Revati"]
         }
+        
+        # These tables are only used for membership tests, so store frozensets
+        for table in (self.group_deities, self.lokas, self.special_taras):
+            for key, names in table.items():
+                table[key] = frozenset(names)
 
     def get_nakshatra_index(self, nakshatra_name: str, scheme: int = 27) -> Optional[int]:
         """Get nakshatra index by name."""
-        nakshatras = self.nakshatras_28 if scheme == 28 else self.nakshatras_27
-        try:
-            return nakshatras.index(nakshatra_name)
-        except ValueError:
-            return None
+        nakshatra_index = self.nakshatra_index_28 if scheme == 28 else self.nakshatra_index_27
+        return nakshatra_index.get(nakshatra_name)
 
     def get_nakshatra_name(self, index: int, scheme: int = 27) -> Optional[str]:
         """Get nakshatra name by index."""
@@ -1,7 +1,7 @@
 """Panchanga service using consolidated SWE service with True Citra Paksha."""
 
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import math
 
 from app.services.swe import swe_service
@@ -109,6 +109,27 @@ class PanchangaService:
             }
         }
     
+    def calculate_panchanga_range(self, start_dt: datetime, n_days: int) -> List[Dict[str, Any]]:
+        """Calculate tithi, nakshatra and yoga for n_days consecutive days at the same time of day."""
+        positions = self.swe_service.calculate_sun_moon_range(start_dt, n_days)
+        
+        results = []
+        current_dt = start_dt
+        one_day = timedelta(days=1)
+        for sun_longitude, moon_longitude in positions:
+            tithi = self._calculate_tithi(sun_longitude, moon_longitude)
+            results.append({
+                'date': current_dt.date().isoformat(),
+                'tithi': tithi,
+                'nakshatra': self._calculate_nakshatra(moon_longitude),
+                'yoga': self._calculate_yoga(sun_longitude, moon_longitude),
+                'karana': self._calculate_karana(tithi['number']),
+                'vara': self._calculate_vara(current_dt)
+            })
+            current_dt += one_day
+        
+        return results
+    
     def _calculate_tithi(self, sun_longitude: float, moon_longitude: float) -> Dict[str, Any]:
         """Calculate tithi using lunar elongation."""
         # Calculate elongation: Moon - Sun
@@ -5,6 +5,7 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
+from types import MappingProxyType
 import asyncio
 
 import swisseph as swe
@@ -27,26 +28,53 @@ PLANETS = {
     "Ketu": None,  # Calculated as Rahu + 180°
 }
 
+# Default planet order for calculate_planets
+PLANET_NAMES = tuple(PLANETS)
+
+# Read-only planet IDs keyed by lowercase name, with Rahu resolved to the configured node mode
+PLANET_IDS = MappingProxyType({
+    name.lower(): swe.TRUE_NODE if name == "Rahu" and settings.node_mode.lower() == "true" else planet_id
+    for name, planet_id in PLANETS.items()
+})
+
 # Pre-calculated constants
 NAKSHATRA_SPAN = 13 + 1/3  # 13°20'
 PADA_SPAN = NAKSHATRA_SPAN / 4  # 3°20'
 RASI_SPAN = 30.0
+PADAS_PER_RASI = 9  # 30° / 3°20'
+TOTAL_PADAS = 108
+UNIX_EPOCH_JD = 2440587.5  # Julian Day of 1970-01-01T00:00:00Z
+SECONDS_PER_DAY = 86400.0
 
 # Rashi (zodiac signs)
-RASHIS = [
+RASHIS = (
     "Mesha", "Vrishabha", "Mithuna", "Karka",
     "Simha", "Kanya", "Tula", "Vrishchika",
     "Dhanu", "Makara", "Kumbha", "Meena"
-]
+)
 
 # Nakshatras
-NAKSHATRAS = [
+NAKSHATRAS = (
     "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
     "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
     "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
     "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishtha", "Shatabhisha",
     "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-]
+)
+
+
+def _angular_indices(longitude: float) -> Tuple[int, int, int]:
+    """Get zero-based (rasi, nakshatra, pada) indices from longitude in one pass."""
+    # 108 padas of 3°20' tile the zodiac; rasi and nakshatra fall out by integer division
+    # Reduce into [0, 360) before truncating, since int() rounds negatives toward zero;
+    # the outer modulo catches tiny negatives that float modulo rounds up to exactly 360.0
+    pada_index = int((longitude % 360.0) * 3.0 / 10.0) % TOTAL_PADAS
+    return pada_index // PADAS_PER_RASI, pada_index >> 2, pada_index & 3
+
+
+def _jd_from_timestamp(timestamp: float) -> float:
+    """Convert a POSIX timestamp to Julian Day (UT)."""
+    return timestamp / SECONDS_PER_DAY + UNIX_EPOCH_JD
 
 
 class SwissEphService:
@@ -109,34 +137,39 @@ class SwissEphService:
         self._get_pada_cached = lru_cache(maxsize=1000)(self._get_pada_uncached)
     
     def _get_planet_id(self, planet_name: str) -> Optional[int]:
-        """Get Swiss Ephemeris planet ID with caching."""
-        planet_name = planet_name.title()
-        if planet_name not in PLANETS:
-            return None
-        
-        planet_id = PLANETS[planet_name]
-        if planet_name == "Rahu" and settings.node_mode.lower() == "true":
-            planet_id = swe.TRUE_NODE
-            
-        return planet_id
+        """Get Swiss Ephemeris planet ID."""
+        return PLANET_IDS.get(planet_name.lower())
     
     def _get_rasi_uncached(self, longitude: float) -> Tuple[str, int]:
         """Get rashi (zodiac sign) from longitude."""
-        rasi_number = int(longitude // RASI_SPAN)
+        rasi_number = _angular_indices(longitude)[0]
         rasi_name = RASHIS[rasi_number]
         return rasi_name, rasi_number + 1
     
     def _get_nakshatra_uncached(self, longitude: float) -> Tuple[str, int]:
         """Get nakshatra from longitude."""
-        nakshatra_number = int(longitude // NAKSHATRA_SPAN)
+        nakshatra_number = _angular_indices(longitude)[1]
         nakshatra_name = NAKSHATRAS[nakshatra_number]
         return nakshatra_name, nakshatra_number + 1
     
     def _get_pada_uncached(self, longitude: float) -> int:
         """Get pada from longitude."""
-        nakshatra_longitude = longitude % NAKSHATRA_SPAN
-        pada = int(nakshatra_longitude // PADA_SPAN) + 1
-        return min(max(pada, 1), 4)  # Ensure pada is between 1 and 4
+        return _angular_indices(longitude)[2] + 1
+    
+    def _position_fields(self, longitude: float) -> Dict:
+        """Build rasi and nakshatra fields for a longitude."""
+        rasi_index, nakshatra_index, pada_index = _angular_indices(longitude)
+        return {
+            "rasi": {
+                "name": RASHIS[rasi_index],
+                "number": rasi_index + 1
+            },
+            "nakshatra": {
+                "name": NAKSHATRAS[nakshatra_index],
+                "number": nakshatra_index + 1,
+                "pada": pada_index + 1
+            }
+        }
     
     def get_rasi(self, longitude: float) -> Tuple[str, int]:
         """Get rashi (zodiac sign) from longitude with caching."""
@@ -157,73 +190,46 @@ class SwissEphService:
         # Use sidereal mode for True Citra Paksha Ayanamsa
         flags = swe.FLG_SIDEREAL | swe.FLG_MOSEPH
         
-        try:
-            result = swe.calc_ut(jd, planet_id, flags)
-            
-            if len(result) >= 1 and isinstance(result[0], (list, tuple)):
-                longitude = result[0][0]
-                latitude = result[0][1] if len(result[0]) > 1 else 0.0
-                distance = result[0][2] if len(result[0]) > 2 else 0.0
-                
-                # Get rashi and nakshatra
-                rasi_name, rasi_number = self.get_rasi(longitude)
-                nakshatra_name, nakshatra_number, pada = self.get_nakshatra(longitude)
-                
-                return {
-                    "longitude": longitude,
-                    "latitude": latitude,
-                    "distance": distance,
-                    "rasi": {
-                        "name": rasi_name,
-                        "number": rasi_number
-                    },
-                    "nakshatra": {
-                        "name": nakshatra_name,
-                        "number": nakshatra_number,
-                        "pada": pada
-                    }
-                }
-            else:
-                raise Exception(f"Calculation failed for {planet_name}: {result}")
-                
-        except Exception as e:
-            logger.error(f"Error calculating {planet_name}: {e}")
-            raise
+        # Errors propagate to the caller; calculate_planets logs them once per planet
+        longitude, latitude, distance = swe.calc_ut(jd, planet_id, flags)[0][:3]
+        
+        return {
+            "longitude": longitude,
+            "latitude": latitude,
+            "distance": distance,
+            **self._position_fields(longitude)
+        }
     
     def calculate_planets(self, dt: datetime, planet_list: Optional[List[str]] = None) -> Dict:
         """Calculate positions for multiple planets."""
         if planet_list is None:
-            planet_list = list(PLANETS.keys())
+            planet_list = PLANET_NAMES
         
         jd = self._get_jd(dt)
         
         results = {}
+        rahu_pos = None
         for planet in planet_list:
             try:
                 if planet == "Ketu":
-                    # Calculate Ketu as Rahu + 180°
-                    rahu_pos = self.calculate_planet_position(jd, "Rahu")
-                    ketu_longitude = (rahu_pos["longitude"] + 180) % 360
-                    
-                    rasi_name, rasi_number = self.get_rasi(ketu_longitude)
-                    nakshatra_name, nakshatra_number, pada = self.get_nakshatra(ketu_longitude)
+                    # Calculate Ketu as Rahu + 180°, reusing Rahu if already computed
+                    if rahu_pos is None:
+                        rahu_pos = self.calculate_planet_position(jd, "Rahu")
+                    # Rahu is in [0, 360), so a single conditional subtract replaces % 360
+                    ketu_longitude = rahu_pos["longitude"] + 180.0
+                    if ketu_longitude >= 360.0:
+                        ketu_longitude -= 360.0
                     
                     results[planet] = {
                         "longitude": ketu_longitude,
                         "latitude": -rahu_pos["latitude"],  # Ketu has opposite latitude
                         "distance": rahu_pos["distance"],
-                        "rasi": {
-                            "name": rasi_name,
-                            "number": rasi_number
-                        },
-                        "nakshatra": {
-                            "name": nakshatra_name,
-                            "number": nakshatra_number,
-                            "pada": pada
-                        }
+                        **self._position_fields(ketu_longitude)
                     }
                 else:
                     results[planet] = self.calculate_planet_position(jd, planet)
+                    if planet == "Rahu":
+                        rahu_pos = results[planet]
                     
             except Exception as e:
                 logger.error(f"Error calculating {planet}: {e}")
@@ -239,6 +245,8 @@ class SwissEphService:
     
     def _get_jd(self, dt: datetime) -> float:
         """Convert datetime to Julian Day."""
+        if dt.tzinfo is not None:
+            return _jd_from_timestamp(dt.timestamp())
         return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0 + dt.second/3600.0)
     
     def calculate_sun_moon_positions(self, dt: datetime) -> Tuple[float, float]:
@@ -250,6 +258,25 @@ class SwissEphService:
         
         return sun_pos["longitude"], moon_pos["longitude"]
     
+    def calculate_sun_moon_range(self, start_dt: datetime, n_days: int) -> List[Tuple[float, float]]:
+        """Calculate daily Sun and Moon longitudes for n_days starting at start_dt."""
+        # Step the Julian Day directly instead of rebuilding datetimes per day
+        start_jd = self._get_jd(start_dt)
+        return self._sun_moon_at_jds([start_jd + day for day in range(n_days)])
+    
+    def calculate_sun_moon_batch(self, dts: List[datetime]) -> List[Tuple[float, float]]:
+        """Calculate Sun and Moon longitudes for many moments in one call."""
+        return self._sun_moon_at_jds([self._get_jd(dt) for dt in dts])
+    
+    def _sun_moon_at_jds(self, jds: List[float]) -> List[Tuple[float, float]]:
+        """Calculate Sun and Moon longitudes for a sequence of Julian Days."""
+        # Resolve flags once and skip the per-planet rasi/nakshatra dict building
+        flags = swe.FLG_SIDEREAL | swe.FLG_MOSEPH
+        return [
+            (swe.calc_ut(jd, swe.SUN, flags)[0][0], swe.calc_ut(jd, swe.MOON, flags)[0][0])
+            for jd in jds
+        ]
+    
     async def calculate_sun_moon_positions_async(self, dt: datetime) -> Tuple[float, float]:
         """Async version of calculate_sun_moon_positions."""
         return await asyncio.get_event_loop().run_in_executor(
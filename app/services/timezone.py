@@ -19,39 +19,31 @@ class TimezoneService:
         self.base_url = "https://maps.googleapis.com/maps/api/timezone/json"
         self.cache = {}
         self.cache_ttl = settings.cache_ttl
+        self.client = self._create_client()
     
-    def _make_request(self, params: Dict) -> Dict:
-        """Make HTTP request to Google Timezone API."""
-        params["key"] = self.api_key
-        
+    def _create_client(self) -> httpx.Client:
+        """Create a persistent HTTP client with connection-level retries."""
         timeout = httpx.Timeout(
             settings.http_timeout,
             connect=settings.http_connect_timeout
         )
+        # Retries are handled by the transport, so failures never block
+        # the worker thread with sleep-based back-off.
+        transport = httpx.HTTPTransport(retries=settings.http_max_retries)
+        return httpx.Client(timeout=timeout, transport=transport)
+    
+    def _make_request(self, params: Dict) -> Dict:
+        """Make HTTP request to Google Timezone API."""
+        params["key"] = self.api_key
+        
+        response = self.client.get(self.base_url, params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        if data.get("status") != "OK":
+            raise ValueError(f"Timezone API error: {data.get('status')}")
         
-        with httpx.Client(timeout=timeout) as client:
-            try:
-                response = client.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                if data.get("status") != "OK":
-                    logger.warning(f"Timezone API error: {data.get('status')}")
-                    return {
-                        "timeZoneId": None,
-                        "rawOffset": None,
-                        "dstOffset": None
-                    }
-                
-                return data
-                
-            except Exception as e:
-                logger.error(f"Timezone API request failed: {e}")
-                return {
-                    "timeZoneId": None,
-                    "rawOffset": None,
-                    "dstOffset": None
-                }
+        return data
     
     def _get_cache_key(self, lat: float, lng: float, timestamp: Optional[int]) -> str:
         """Generate cache key for timezone request."""
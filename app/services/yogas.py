@@ -1,11 +1,19 @@
 """Yogas service for detecting panchanga combinations."""
 
+import heapq
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
-from app.services.swe import swe_service
+from app.services.sunrise_precise import precise_sunrise_service
+from app.services.swe import swe_service, _angular_indices
 from app.util.logging import get_logger
 
 logger = get_logger("yogas")
@@ -235,54 +243,46 @@ YOGAS_DEFINITIONS = {
     }
 }
 
+# Definitions are read-only after import; freeze them so detection code cannot mutate shared state
+YOGAS_DEFINITIONS = MappingProxyType({
+    yoga_name: MappingProxyType(yoga_def) for yoga_name, yoga_def in YOGAS_DEFINITIONS.items()
+})
+
+ONE_DAY = timedelta(days=1)
+
+# Most serialized single-day results kept per service; the least recently used is evicted first
+DETECTION_CACHE_SIZE = 4096
+
+# Approximate local sunrise used when the precise calculation fails
+FALLBACK_SUNRISE = time(6, 30)
+
+# Sort key for yoga rows; each row already carries its definition's priority
+_yoga_priority = itemgetter("priority")
+
+# Weekday names indexed by Python's date.weekday() (Monday=0)
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+WEEKDAY_INDEX = {name: index for index, name in enumerate(WEEKDAYS)}
+
 # Nakshatra names with proper diacritics
-NAKSHATRAS_WITH_DIACRITICS = [
+NAKSHATRAS_WITH_DIACRITICS = (
     "Aśvinī", "Bharaṇī", "Kṛttikā", "Rohiṇī", "Mṛgaśira", "Ārdrā",
     "Punarvasu", "Puṣya", "Āśleṣā", "Maghā", "Pūrva Phalgunī", "Uttara Phalgunī",
     "Hasta", "Citrā", "Svātī", "Viśākhā", "Anurādhā", "Jyeṣṭhā",
     "Mūla", "Pūrva Āṣāḍhā", "Uttara Āṣāḍhā", "Śravaṇa", "Dhaniṣṭhā", "Śatabhiṣā",
     "Pūrva Bhādrapadā", "Uttara Bhādrapadā", "Revatī"
-]
-
-# Nakshatra names without diacritics (for compatibility)
-NAKSHATRAS_WITHOUT_DIACRITICS = [
-    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
-    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishtha", "Shatabhisha",
-    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-]
-
-# Mapping from SWE names to diacritic names
-NAKSHATRA_MAPPING = {
-    "Ashwini": "Aśvinī",
-    "Bharani": "Bharaṇī", 
-    "Krittika": "Kṛttikā",
-    "Rohini": "Rohiṇī",
-    "Mrigashira": "Mṛgaśira",
-    "Ardra": "Ārdrā",
-    "Punarvasu": "Punarvasu",
-    "Pushya": "Puṣya",
-    "Ashlesha": "Āśleṣā",
-    "Magha": "Maghā",
-    "Purva Phalguni": "Pūrva Phalgunī",
-    "Uttara Phalguni": "Uttara Phalgunī",
-    "Hasta": "Hasta",
-    "Chitra": "Citrā",
-    "Swati": "Svātī",
-    "Vishakha": "Viśākhā",
-    "Anuradha": "Anurādhā",
-    "Jyeshtha": "Jyeṣṭhā",
-    "Mula": "Mūla",
-    "Purva Ashadha": "Pūrva Āṣāḍhā",
-    "Uttara Ashadha": "Uttara Āṣāḍhā",
-    "Shravana": "Śravaṇa",
-    "Dhanishtha": "Dhaniṣṭhā",
-    "Shatabhisha": "Śatabhiṣā",
-    "Purva Bhadrapada": "Pūrva Bhādrapadā",
-    "Uttara Bhadrapada": "Uttara Bhādrapadā",
-    "Revati": "Revatī"
-}
+)
+
+NAKSHATRA_INDEX = {name: index for index, name in enumerate(NAKSHATRAS_WITH_DIACRITICS)}
+
+# Tithi names indexed by tithi - 1 (Shukla 1-15, Krishna 16-30)
+TITHI_NAMES = (
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
+    "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
+    "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima",
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
+    "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
+    "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Amavasya"
+)
 
 # Tithi groups for special yogas
 TITHI_GROUPS = {
@@ -293,6 +293,19 @@ TITHI_GROUPS = {
     "Purna": [5, 10, 15, 20, 25, 30]
 }
 
+
+def _build_tithi_group_table(tithi_groups: Dict[str, List[int]]) -> Tuple[str, ...]:
+    """Invert group -> tithis into a table indexed by tithi number (0-30)."""
+    table = ["Unknown"] * 31
+    for group, tithis in tithi_groups.items():
+        for tithi in tithis:
+            table[tithi] = group
+    return tuple(table)
+
+
+# Tithi group by tithi number (index 0 is unused)
+TITHI_GROUP_BY_NUMBER = _build_tithi_group_table(TITHI_GROUPS)
+
 # Vara-Tithi group combinations for special yogas
 VARA_TITHI_YOGAS = {
     ("Sunday", "Nanda"): "Siddhi",
@@ -337,7 +350,7 @@ VARA_TITHI_YOGAS = {
 }
 
 # Dagdha combinations (Vara + Tithi)
-DAGDHA_COMBINATIONS = [
+DAGDHA_COMBINATIONS = frozenset([
     ("Sunday", 12), ("Sunday", 6), ("Sunday", 21), ("Sunday", 27),
     ("Monday", 7), ("Monday", 12), ("Monday", 22), ("Monday", 27),
     ("Tuesday", 8), ("Tuesday", 13), ("Tuesday", 23), ("Tuesday", 28),
@@ -345,10 +358,10 @@ DAGDHA_COMBINATIONS = [
     ("Thursday", 10), ("Thursday", 15), ("Thursday", 25), ("Thursday", 30),
     ("Friday", 11), ("Friday", 16), ("Friday", 26), ("Friday", 1),
     ("Saturday", 5), ("Saturday", 11), ("Saturday", 21), ("Saturday", 26)
-]
+])
 
 # Visha combinations (Vara + Tithi)
-VISHA_COMBINATIONS = [
+VISHA_COMBINATIONS = frozenset([
     ("Sunday", 6), ("Sunday", 12), ("Sunday", 21), ("Sunday", 27),
     ("Monday", 7), ("Monday", 13), ("Monday", 22), ("Monday", 28),
     ("Tuesday", 8), ("Tuesday", 14), ("Tuesday", 23), ("Tuesday", 29),
@@ -356,10 +369,10 @@ VISHA_COMBINATIONS = [
     ("Thursday", 10), ("Thursday", 16), ("Thursday", 25), ("Thursday", 1),
     ("Friday", 11), ("Friday", 17), ("Friday", 26), ("Friday", 2),
     ("Saturday", 5), ("Saturday", 12), ("Saturday", 21), ("Saturday", 27)
-]
+])
 
 # Hutasana combinations (Vara + Tithi)
-HUTASANA_COMBINATIONS = [
+HUTASANA_COMBINATIONS = frozenset([
     ("Sunday", 1), ("Sunday", 7), ("Sunday", 13), ("Sunday", 19), ("Sunday", 25),
     ("Monday", 2), ("Monday", 8), ("Monday", 14), ("Monday", 20), ("Monday", 26),
     ("Tuesday", 3), ("Tuesday", 9), ("Tuesday", 15), ("Tuesday", 21), ("Tuesday", 27),
@@ -367,10 +380,32 @@ HUTASANA_COMBINATIONS = [
     ("Thursday", 5), ("Thursday", 11), ("Thursday", 17), ("Thursday", 23), ("Thursday", 29),
     ("Friday", 6), ("Friday", 12), ("Friday", 18), ("Friday", 24), ("Friday", 30),
     ("Saturday", 7), ("Saturday", 13), ("Saturday", 19), ("Saturday", 25)
-]
+])
+
+
+def _vara_tithi_key(vara: str, tithi: int) -> int:
+    """Pack a (vara, tithi) pair into one small integer key."""
+    return WEEKDAY_INDEX[vara] * 32 + tithi
+
+
+def _build_vara_tithi_index(combinations_by_yoga: Dict[str, FrozenSet[Tuple[str, int]]]) -> Dict[int, Tuple[str, ...]]:
+    """Invert yoga -> (vara, tithi) combinations into packed (vara, tithi) key -> yoga names."""
+    index = {}
+    for yoga_name, combinations in combinations_by_yoga.items():
+        for vara, tithi in combinations:
+            index.setdefault(_vara_tithi_key(vara, tithi), []).append(yoga_name)
+    return {key: tuple(yoga_names) for key, yoga_names in index.items()}
+
+
+# Negative vara+tithi yogas indexed by _vara_tithi_key(vara, tithi), in check order
+VARA_TITHI_NEGATIVE_YOGAS = _build_vara_tithi_index({
+    "Dagdha": DAGDHA_COMBINATIONS,
+    "Visha": VISHA_COMBINATIONS,
+    "Hutasana": HUTASANA_COMBINATIONS
+})
 
 # Panchaka nakshatras and their classifications
-PANCHAKA_NAKSHATRAS = ["Āśleṣā", "Maghā", "Jyeṣṭhā", "Mūla", "Revatī"]
+PANCHAKA_NAKSHATRAS = frozenset(["Āśleṣā", "Maghā", "Jyeṣṭhā", "Mūla", "Revatī"])
 PANCHAKA_CLASSIFICATIONS = {
     "Sunday": "Agni",
     "Monday": "Indra", 
@@ -380,6 +415,11 @@ PANCHAKA_CLASSIFICATIONS = {
     "Friday": "Kubera",
     "Saturday": "Naga"
 }
+# Panchaka notes per vara, formatted once instead of on every match
+PANCHAKA_NOTES = {
+    vara: f"Clasificación: {classification}"
+    for vara, classification in PANCHAKA_CLASSIFICATIONS.items()
+}
 
 # Special Vara-Nakshatra combinations
 VARA_NAKSHATRA_YOGAS = {
@@ -390,22 +430,86 @@ VARA_NAKSHATRA_YOGAS = {
     ("Monday", "Śravaṇa"): "Chandra Yoga"
 }
 
+
+def _vara_nakshatra_key(vara: str, nakshatra: str) -> int:
+    """Pack a (vara, nakshatra) pair into one small integer key."""
+    return WEEKDAY_INDEX[vara] * 32 + NAKSHATRA_INDEX[nakshatra]
+
+
+# Vara-Nakshatra yogas keyed by _vara_nakshatra_key(vara, nakshatra)
+VARA_NAKSHATRA_YOGAS_BY_KEY = {
+    _vara_nakshatra_key(vara, nakshatra): yoga_name
+    for (vara, nakshatra), yoga_name in VARA_NAKSHATRA_YOGAS.items()
+}
+
+
+def _yoga_template(yoga_name: str, yoga_type: str, polarity: str) -> MappingProxyType:
+    """Build the constant fields of a detected yoga row from its definition."""
+    yoga_def = YOGAS_DEFINITIONS.get(yoga_name, {})
+    description = yoga_def.get("description", "")
+    return MappingProxyType({
+        "name": yoga_name,
+        "type": yoga_type,
+        "beneficial": description if polarity == "positive" else "",
+        "avoid": "" if polarity == "positive" else description,
+        "detailed_description": yoga_def.get("detailed_description", ""),
+        "notes": "",
+        "polarity": polarity,
+        "priority": yoga_def.get("priority", 3)
+    })
+
+
+# Read-only prototype of every detectable yoga row; detection copies it and adds per-day fields
+YOGA_TEMPLATES = {
+    **{name: _yoga_template(name, "vara+tithi_group", "positive") for name in VARA_TITHI_YOGAS.values()},
+    **{name: _yoga_template(name, "vara+nakshatra", "positive") for name in VARA_NAKSHATRA_YOGAS.values()},
+    "Ravi Yoga": _yoga_template("Ravi Yoga", "sun+moon", "positive"),
+    "Ravi Pushya": _yoga_template("Ravi Pushya", "sun+nakshatra", "positive"),
+    **{name: _yoga_template(name, "vara+tithi", "negative") for name in ("Dagdha", "Visha", "Hutasana")},
+    "Panchaka": _yoga_template("Panchaka", "nakshatra+weekday", "negative")
+}
+
+
+def _panchanga_core(sun_lon: float, moon_lon: float) -> Tuple[float, int, int, int, int, int]:
+    """Get elongation, tithi, and Moon and Sun nakshatra index and pada from two longitudes."""
+    elongation = (moon_lon - sun_lon) % 360
+    # Share SWEService's index math so yogas and the ephemeris endpoints agree at pada boundaries
+    _, moon_index, moon_pada_index = _angular_indices(moon_lon)
+    _, sun_index, sun_pada_index = _angular_indices(sun_lon)
+    return (
+        elongation,
+        int(elongation / 12) % 15 + 1,  # Tithis 16-30 (Krishna paksha) fold onto 1-15
+        moon_index,
+        moon_pada_index + 1,
+        sun_index,
+        sun_pada_index + 1
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_yoga_rules() -> Dict:
+    """Load yoga rules from JSON file once per process."""
+    try:
+        rules_path = os.path.join(os.path.dirname(__file__), "..", "..", "rules", "panchanga_rules.json")
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"Error loading yoga rules: {e}")
+        return {"positive": {}, "negative": {}}
+
+
 class YogasService:
     """Service for detecting panchanga yogas."""
     
+    __slots__ = ("swe_service", "rules", "_results", "_results_lock")
+    
     def __init__(self):
         self.swe_service = swe_service
-        self.rules = self._load_yoga_rules()
-    
-    def _load_yoga_rules(self) -> Dict:
-        """Load yoga rules from JSON file."""
-        try:
-            rules_path = os.path.join(os.path.dirname(__file__), "..", "..", "rules", "panchanga_rules.json")
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading yoga rules: {e}")
-            return {"positive": {}, "negative": {}}
+        self.rules = _load_yoga_rules()
+        # Single-day results keyed by (dt, latitude, longitude), stored as JSON so every
+        # caller gets its own mutable copy; range detection fills missing days in one batch
+        self._results: "OrderedDict[tuple, str]" = OrderedDict()
+        self._results_lock = threading.Lock()
     
     def get_weekday(self, dt: datetime) -> str:
         """Get weekday name."""
@@ -413,15 +517,10 @@ class YogasService:
         # The vara is determined by the day on which the sunrise occurs
         # NOT by whether sunrise is before or after 6 AM
         
-        # Get the date of the sunrise
-        sunrise_date = dt.date()
-        
-        # Calculate weekday for the sunrise date
+        # datetime.weekday() already ignores the time of day, so there is
+        # no need to build an intermediate date object
         # Python weekday(): Monday=0, Tuesday=1, ..., Sunday=6
-        # Vedic Vara: Sunday=1, Monday=2, ..., Saturday=7
-        weekday = sunrise_date.weekday()
-        weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        return weekdays[weekday]
+        return WEEKDAYS[dt.weekday()]
     
     def detect_yogas(
         self,
@@ -430,81 +529,166 @@ class YogasService:
         longitude: float
     ) -> Dict:
         """Detect panchanga yogas for a specific date and location."""
+        return json.loads(self.detect_yogas_json(dt, latitude, longitude))
+    
+    def detect_yogas_json(self, dt: datetime, latitude: float, longitude: float) -> str:
+        """Detect panchanga yogas and return the cached, already serialized JSON payload."""
         try:
-            # Calculate actual sunrise time for the location
-            from app.services.sunrise_precise import precise_sunrise_service
-            
-            try:
-                # Get actual sunrise time for the location
-                sunrise_dt = precise_sunrise_service.calculate_sunrise(dt, latitude, longitude)
-                dt_with_time = sunrise_dt
-            except Exception as e:
-                # Fallback to approximate sunrise time (6:30 AM local time)
-                logger.warning(f"Could not calculate precise sunrise, using fallback: {e}")
-                dt_with_time = datetime.combine(dt.date(), datetime.strptime("06:30:00", "%H:%M:%S").time())
+            key = (dt, latitude, longitude)
+            payload = self._cached_result(key)
+            if payload is None:
+                payload = self._detect_yogas_json(dt, latitude, longitude)
+                self._store_result(key, payload)
+            return payload
             
-            # Calculate planetary positions using SWE service at sunrise
-            planet_data = self.swe_service.calculate_planets(dt_with_time, ["Sun", "Moon"])
-            
-            sun_lon = planet_data["Sun"]["longitude"]
-            moon_lon = planet_data["Moon"]["longitude"]
-            
-            # Get nakshatra names from SWE and convert to diacritic names
-            sun_nakshatra_swe = planet_data["Sun"]["nakshatra"]["name"]
-            moon_nakshatra_swe = planet_data["Moon"]["nakshatra"]["name"]
-            
-            sun_nakshatra = self._get_nakshatra_from_swe(sun_nakshatra_swe)
-            nakshatra = self._get_nakshatra_from_swe(moon_nakshatra_swe)
-            
-            # Calculate panchanga elements
-            tithi = self._calculate_tithi(sun_lon, moon_lon)
-            weekday = self.get_weekday(dt_with_time)  # Use dt_with_time instead of dt
-            
-            # Get tithi group
-            tithi_group = self._get_tithi_group(tithi)
-            
-            # Check special yogas
-            positive_yogas = self._check_special_positive_yogas(weekday, tithi, tithi_group, nakshatra, sun_nakshatra, sun_lon, moon_lon)
-            negative_yogas = self._check_special_negative_yogas(weekday, tithi, tithi_group, nakshatra, sun_nakshatra)
+        except Exception as e:
+            logger.error(f"Error detecting yogas: {e}")
+            raise
+    
+    def _detect_yogas_json(self, dt: datetime, latitude: float, longitude: float) -> str:
+        """Detect yogas for one date and location and serialize the result."""
+        dt_with_time = self._get_sunrise(dt, latitude, longitude)
+        
+        # Calculate planetary positions at sunrise
+        sun_lon, moon_lon = self.swe_service.calculate_sun_moon_positions(dt_with_time)
+        
+        return json.dumps(self._build_yogas_result(dt, dt_with_time, sun_lon, moon_lon, latitude, longitude))
+    
+    def detect_yogas_range(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        latitude: float,
+        longitude: float
+    ) -> List[Dict]:
+        """Detect panchanga yogas for every day from start_dt to end_dt inclusive."""
+        return json.loads(self.detect_yogas_range_json(start_dt, end_dt, latitude, longitude))
+    
+    def detect_yogas_range_json(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        latitude: float,
+        longitude: float
+    ) -> str:
+        """Detect yogas for a date range and return the days as one JSON array."""
+        try:
+            n_days = (end_dt.date() - start_dt.date()).days + 1
+            days = []
+            day = start_dt
+            for _ in range(n_days):
+                days.append(day)
+                day += ONE_DAY
             
-            # Sort yogas by priority
-            positive_yogas.sort(key=lambda x: YOGAS_DEFINITIONS.get(x["name"], {}).get("priority", 3))
-            negative_yogas.sort(key=lambda x: YOGAS_DEFINITIONS.get(x["name"], {}).get("priority", 3))
+            # Serve cached days as they are, then resolve sunrises and ephemeris for
+            # all missing days in one batched call and add them to the per-day cache
+            payloads = [self._cached_result((day, latitude, longitude)) for day in days]
+            missing = [index for index, payload in enumerate(payloads) if payload is None]
+            if missing:
+                sunrises = [self._get_sunrise(days[index], latitude, longitude) for index in missing]
+                positions = self.swe_service.calculate_sun_moon_batch(sunrises)
+                for index, sunrise, (sun_lon, moon_lon) in zip(missing, sunrises, positions):
+                    day = days[index]
+                    payload = json.dumps(
+                        self._build_yogas_result(day, sunrise, sun_lon, moon_lon, latitude, longitude)
+                    )
+                    self._store_result((day, latitude, longitude), payload)
+                    payloads[index] = payload
             
-            return {
-                "date": dt.date().isoformat(),
-                "location": {
-                    "latitude": latitude,
-                    "longitude": longitude
-                },
-                "panchanga": {
-                    "vara": weekday,
-                    "tithi": {
-                        "tithi_number": tithi,
-                        "tithi_name": self._get_tithi_name(tithi),
-                        "paksha": "Krishna" if (moon_lon - sun_lon) % 360 >= 180 else "Shukla",
-                        "paksha_short": "K" if (moon_lon - sun_lon) % 360 >= 180 else "S",
-                        "display": f"{'K' if (moon_lon - sun_lon) % 360 >= 180 else 'S'}{tithi}",
-                        "sun_longitude": sun_lon,
-                        "moon_longitude": moon_lon,
-                        "difference": (moon_lon - sun_lon) % 360
-                    },
-                    "nakshatra": [nakshatra, self._get_nakshatra_index(moon_lon), self._get_nakshatra_pada(moon_lon)],
-                    "sun_nakshatra": [sun_nakshatra, self._get_nakshatra_index(sun_lon), self._get_nakshatra_pada(sun_lon)]
-                },
-                "positive_yogas": positive_yogas,
-                "negative_yogas": negative_yogas,
-                "total_positive": len(positive_yogas),
-                "total_negative": len(negative_yogas),
-                "summary": self._generate_yoga_summary(positive_yogas, negative_yogas)
-            }
+            return "[" + ", ".join(payloads) + "]"
             
         except Exception as e:
-            logger.error(f"Error detecting yogas: {e}")
+            logger.error(f"Error detecting yogas for range: {e}")
             raise
     
+    def _cached_result(self, key: tuple) -> Optional[str]:
+        """Get a cached single-day payload and mark it as recently used."""
+        with self._results_lock:
+            payload = self._results.get(key)
+            if payload is not None:
+                self._results.move_to_end(key)
+            return payload
+    
+    def _store_result(self, key: tuple, payload: str) -> None:
+        """Cache a single-day payload, evicting the least recently used entry when full."""
+        with self._results_lock:
+            self._results[key] = payload
+            self._results.move_to_end(key)
+            if len(self._results) > DETECTION_CACHE_SIZE:
+                self._results.popitem(last=False)
+    
+    def _get_sunrise(self, dt: datetime, latitude: float, longitude: float) -> datetime:
+        """Get sunrise moment for a date and location, with a 6:30 fallback."""
+        try:
+            # Get actual sunrise time for the location
+            return precise_sunrise_service.calculate_sunrise(dt, latitude, longitude)
+        except Exception as e:
+            # Fallback to approximate sunrise time (6:30 AM local time)
+            logger.warning(f"Could not calculate precise sunrise, using fallback: {e}")
+            return datetime.combine(dt.date(), FALLBACK_SUNRISE)
+    
+    def _build_yogas_result(
+        self,
+        dt: datetime,
+        dt_with_time: datetime,
+        sun_lon: float,
+        moon_lon: float,
+        latitude: float,
+        longitude: float
+    ) -> Dict:
+        """Build the yoga detection result for one day from sunrise positions."""
+        # Calculate panchanga elements in one pass over the two longitudes
+        (elongation, tithi, moon_nakshatra_index, moon_pada,
+         sun_nakshatra_index, sun_pada) = _panchanga_core(sun_lon, moon_lon)
+        
+        # One index per body drives both the diacritic name and the output array,
+        # so the name and index can never disagree at a nakshatra boundary
+        nakshatra = NAKSHATRAS_WITH_DIACRITICS[moon_nakshatra_index]
+        sun_nakshatra = NAKSHATRAS_WITH_DIACRITICS[sun_nakshatra_index]
+        is_krishna = elongation >= 180
+        weekday = WEEKDAYS[dt_with_time.weekday()]  # Vara of the sunrise date, not dt
+        
+        # Get tithi group
+        tithi_group = self._get_tithi_group(tithi)
+        
+        # Check special yogas
+        positive_yogas = self._check_special_positive_yogas(weekday, tithi, tithi_group, nakshatra, sun_nakshatra, sun_lon, moon_lon, elongation)
+        negative_yogas = self._check_special_negative_yogas(weekday, tithi, tithi_group, nakshatra, sun_nakshatra)
+        
+        # Sort yogas by priority
+        positive_yogas.sort(key=_yoga_priority)
+        negative_yogas.sort(key=_yoga_priority)
+        
+        return {
+            "date": dt.date().isoformat(),
+            "location": {
+                "latitude": latitude,
+                "longitude": longitude
+            },
+            "panchanga": {
+                "vara": weekday,
+                "tithi": {
+                    "tithi_number": tithi,
+                    "tithi_name": self._get_tithi_name(tithi),
+                    "paksha": "Krishna" if is_krishna else "Shukla",
+                    "paksha_short": "K" if is_krishna else "S",
+                    "display": f"{'K' if is_krishna else 'S'}{tithi}",
+                    "sun_longitude": sun_lon,
+                    "moon_longitude": moon_lon,
+                    "difference": elongation
+                },
+                "nakshatra": [nakshatra, moon_nakshatra_index, moon_pada],
+                "sun_nakshatra": [sun_nakshatra, sun_nakshatra_index, sun_pada]
+            },
+            "positive_yogas": positive_yogas,
+            "negative_yogas": negative_yogas,
+            "total_positive": len(positive_yogas),
+            "total_negative": len(negative_yogas),
+            "summary": self._generate_yoga_summary(positive_yogas, negative_yogas)
+        }
+    
     def _generate_yoga_summary(self, positive_yogas: List[Dict], negative_yogas: List[Dict]) -> Dict:
-        """Generate a summary of the yogas for the day."""
+        """Generate a summary of the yogas for the day from priority-sorted lists."""
         total_yogas = len(positive_yogas) + len(negative_yogas)
         
         if total_yogas == 0:
@@ -514,11 +698,10 @@ class YogasService:
                 "priority_yogas": []
             }
         
-        # Get highest priority yogas
-        all_yogas = positive_yogas + negative_yogas
-        all_yogas.sort(key=lambda x: YOGAS_DEFINITIONS.get(x["name"], {}).get("priority", 3))
-        
-        priority_yogas = all_yogas[:3]  # Top 3 yogas
+        # Get highest priority yogas; both lists are already sorted by priority,
+        # so merging them yields the same order as a stable sort of their concatenation
+        merged = heapq.merge(positive_yogas, negative_yogas, key=_yoga_priority)
+        priority_yogas = list(islice(merged, 3))  # Top 3 yogas
         
         # Determine overall muhurta
         if len(positive_yogas) > len(negative_yogas):
@@ -537,70 +720,13 @@ class YogasService:
             "priority_yogas": priority_yogas
         }
     
-    def _calculate_tithi(self, sun_lon: float, moon_lon: float) -> int:
-        """Calculate tithi from Sun and Moon longitudes - corrected logic."""
-        elongation = (moon_lon - sun_lon) % 360
-        
-        # Calculate tithi number correctly
-        tithi_number = int(elongation / 12) + 1
-        
-        # Determine paksha and adjust tithi for Krishna paksha
-        if elongation < 180:
-            # Shukla paksha - tithi_number is correct (1-15)
-            pass
-        else:
-            # Krishna paksha - adjust tithi_number to (1-15)
-            tithi_number = tithi_number - 15
-            if tithi_number <= 0:
-                tithi_number += 15
-        
-        # Ensure tithi_number is in correct range
-        if tithi_number < 1:
-            tithi_number = 1
-        elif tithi_number > 15:
-            tithi_number = 15
-            
-        return tithi_number
-    
     def _get_tithi_name(self, tithi: int) -> str:
         """Get tithi name."""
-        tithi_names = [
-            "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
-            "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
-            "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima",
-            "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
-            "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
-            "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Amavasya"
-        ]
-        return tithi_names[tithi - 1]
+        return TITHI_NAMES[tithi - 1]
     
     def _get_tithi_group(self, tithi: int) -> str:
         """Get tithi group."""
-        for group, tithis in TITHI_GROUPS.items():
-            if tithi in tithis:
-                return group
-        return "Unknown"
-    
-    def _get_nakshatra(self, longitude: float) -> str:
-        """Get nakshatra name with diacritics from longitude."""
-        nakshatra_span = 13 + 1/3
-        nak_index = int(longitude // nakshatra_span)
-        return NAKSHATRAS_WITH_DIACRITICS[nak_index]
-    
-    def _get_nakshatra_from_swe(self, swe_name: str) -> str:
-        """Convert SWE nakshatra name to diacritic name."""
-        return NAKSHATRA_MAPPING.get(swe_name, swe_name)
-    
-    def _get_nakshatra_index(self, longitude: float) -> int:
-        """Get nakshatra index from longitude."""
-        nakshatra_span = 13 + 1/3
-        return int(longitude // nakshatra_span)
-    
-    def _get_nakshatra_pada(self, longitude: float) -> int:
-        """Get nakshatra pada from longitude."""
-        nakshatra_span = 13 + 1/3
-        position_in_nakshatra = (longitude % nakshatra_span) / (nakshatra_span / 4)
-        return int(position_in_nakshatra) + 1
+        return TITHI_GROUP_BY_NUMBER[tithi] if 0 <= tithi <= 30 else "Unknown"
     
     def _check_special_positive_yogas(
         self, 
@@ -610,80 +736,37 @@ class YogasService:
         nakshatra: str,
         sun_nakshatra: str,
         sun_lon: float,
-        moon_lon: float
+        moon_lon: float,
+        elongation: float
     ) -> List[Dict]:
         """Check for special positive yogas."""
         yogas = []
         
         # Check Vara-Tithi group combinations
-        if (weekday, tithi_group) in VARA_TITHI_YOGAS:
-            yoga_name = VARA_TITHI_YOGAS[(weekday, tithi_group)]
-            yoga_def = YOGAS_DEFINITIONS.get(yoga_name, {})
-            
-            yogas.append({
-                "name": yoga_name,
-                "type": "vara+tithi_group",
-                "vara": weekday,
-                "tithi_group": tithi_group,
-                "tithi_number": tithi,
-                "beneficial": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "avoid": "",
-                "notes": "",
-                "polarity": "positive",
-                "priority": yoga_def.get("priority", 3)
-            })
+        yoga_name = VARA_TITHI_YOGAS.get((weekday, tithi_group))
+        if yoga_name is not None:
+            row = YOGA_TEMPLATES[yoga_name].copy()
+            row.update(vara=weekday, tithi_group=tithi_group, tithi_number=tithi)
+            yogas.append(row)
         
         # Check Vara-Nakshatra combinations
-        if (weekday, nakshatra) in VARA_NAKSHATRA_YOGAS:
-            yoga_name = VARA_NAKSHATRA_YOGAS[(weekday, nakshatra)]
-            yoga_def = YOGAS_DEFINITIONS.get(yoga_name, {})
-            
-            yogas.append({
-                "name": yoga_name,
-                "type": "vara+nakshatra",
-                "vara": weekday,
-                "nakshatra": nakshatra,
-                "beneficial": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "avoid": "",
-                "notes": "",
-                "polarity": "positive",
-                "priority": yoga_def.get("priority", 3)
-            })
+        yoga_name = VARA_NAKSHATRA_YOGAS_BY_KEY.get(_vara_nakshatra_key(weekday, nakshatra))
+        if yoga_name is not None:
+            row = YOGA_TEMPLATES[yoga_name].copy()
+            row.update(vara=weekday, nakshatra=nakshatra)
+            yogas.append(row)
         
-        # Check Ravi Yoga (Sun-Moon relationship)
-        sun_moon_diff = abs(sun_lon - moon_lon)
-        if 0 <= sun_moon_diff <= 12 or 348 <= sun_moon_diff <= 360:
-            yoga_def = YOGAS_DEFINITIONS.get("Ravi Yoga", {})
-            yogas.append({
-                "name": "Ravi Yoga",
-                "type": "sun+moon",
-                "sun_longitude": sun_lon,
-                "moon_longitude": moon_lon,
-                "difference": sun_moon_diff,
-                "beneficial": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "avoid": "",
-                "notes": "",
-                "polarity": "positive",
-                "priority": yoga_def.get("priority", 3)
-            })
+        # Check Ravi Yoga (Sun and Moon within 12° of each other, across the 0°/360° wrap)
+        if elongation <= 12 or elongation >= 348:
+            row = YOGA_TEMPLATES["Ravi Yoga"].copy()
+            row.update(sun_longitude=sun_lon, moon_longitude=moon_lon, difference=elongation)
+            yogas.append(row)
         
         # Check Ravi Pushya (Sun in Pushya)
         if sun_nakshatra == "Puṣya":
-            yoga_def = YOGAS_DEFINITIONS.get("Ravi Pushya", {})
-            yogas.append({
-                "name": "Ravi Pushya",
-                "type": "sun+nakshatra",
-                "sun_nakshatra": sun_nakshatra,
-                "beneficial": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "avoid": "",
-                "notes": "",
-                "polarity": "positive",
-                "priority": yoga_def.get("priority", 3)
-            })
+            row = YOGA_TEMPLATES["Ravi Pushya"].copy()
+            row.update(sun_nakshatra=sun_nakshatra)
+            yogas.append(row)
         
         return yogas
     
@@ -698,71 +781,23 @@ class YogasService:
         """Check for special negative yogas."""
         yogas = []
         
-        # Check Dagdha
-        if (weekday, tithi) in DAGDHA_COMBINATIONS:
-            yoga_def = YOGAS_DEFINITIONS.get("Dagdha", {})
-            yogas.append({
-                "name": "Dagdha",
-                "type": "vara+tithi",
-                "vara": weekday,
-                "tithi_number": tithi,
-                "beneficial": "",
-                "avoid": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "notes": "",
-                "polarity": "negative",
-                "priority": yoga_def.get("priority", 3)
-            })
-        
-        # Check Visha
-        if (weekday, tithi) in VISHA_COMBINATIONS:
-            yoga_def = YOGAS_DEFINITIONS.get("Visha", {})
-            yogas.append({
-                "name": "Visha",
-                "type": "vara+tithi",
-                "vara": weekday,
-                "tithi_number": tithi,
-                "beneficial": "",
-                "avoid": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "notes": "",
-                "polarity": "negative",
-                "priority": yoga_def.get("priority", 3)
-            })
-        
-        # Check Hutasana
-        if (weekday, tithi) in HUTASANA_COMBINATIONS:
-            yoga_def = YOGAS_DEFINITIONS.get("Hutasana", {})
-            yogas.append({
-                "name": "Hutasana",
-                "type": "vara+tithi",
-                "vara": weekday,
-                "tithi_number": tithi,
-                "beneficial": "",
-                "avoid": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "notes": "",
-                "polarity": "negative",
-                "priority": yoga_def.get("priority", 3)
-            })
+        # Check Dagdha, Visha and Hutasana with a single index lookup
+        for yoga_name in VARA_TITHI_NEGATIVE_YOGAS.get(_vara_tithi_key(weekday, tithi), ()):
+            row = YOGA_TEMPLATES[yoga_name].copy()
+            row.update(vara=weekday, tithi_number=tithi)
+            yogas.append(row)
         
         # Check Panchaka
         if nakshatra in PANCHAKA_NAKSHATRAS:
             classification = PANCHAKA_CLASSIFICATIONS.get(weekday, "")
-            yoga_def = YOGAS_DEFINITIONS.get("Panchaka", {})
-            yogas.append({
-                "name": "Panchaka",
-                "type": "nakshatra+weekday",
-                "vara": weekday,
-                "nakshatra": nakshatra,
-                "classification": classification,
-                "beneficial": "",
-                "avoid": yoga_def.get("description", ""),
-                "detailed_description": yoga_def.get("detailed_description", ""),
-                "notes": f"Clasificación: {classification}",
-                "polarity": "negative",
-                "priority": yoga_def.get("priority", 3)
-            })
+            row = YOGA_TEMPLATES["Panchaka"].copy()
+            row.update(
+                vara=weekday,
+                nakshatra=nakshatra,
+                classification=classification,
+                notes=PANCHAKA_NOTES.get(weekday, "Clasificación: ")
+            )
+            yogas.append(row)
         
         return yogas
 
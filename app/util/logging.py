@@ -1,39 +1,68 @@
 """JSON logging configuration for Jyotiṣa API."""
 
+import itertools
 import json
 import logging
+import os
 import sys
 import time
-import uuid
-from datetime import datetime
 from typing import Any, Dict
 
 from app.config import settings
 
+# Fields passed through logging's ``extra`` that are copied into JSON records
+EXTRA_FIELDS = ("route", "latency_ms", "status", "req_id", "error")
+
+# Process-local request ids: "<pid hex>-<counter hex>" is unique per process without a uuid4 draw
+_PID_HEX = format(os.getpid(), "x")
+_REQ_COUNTER = itertools.count()
+
+
+def _reset_request_ids() -> None:
+    """Refresh the request id prefix in forked worker processes."""
+    global _PID_HEX, _REQ_COUNTER
+    _PID_HEX = format(os.getpid(), "x")
+    _REQ_COUNTER = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+# Set once setup_logging has installed its handlers, so repeated calls are no-ops
+_logging_configured = False
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, its formatted UTC prefix), replaced as one tuple so threads never see a mixed pair
+        self._second_cache = (None, "")
+    
+    def _timestamp(self, created: float) -> str:
+        """Format a record time as ISO 8601 UTC, reformatting the date part once per second."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
         # Add extra fields if present
-        if hasattr(record, "route"):
-            log_entry["route"] = record.route
-        if hasattr(record, "latency_ms"):
-            log_entry["latency_ms"] = record.latency_ms
-        if hasattr(record, "status"):
-            log_entry["status"] = record.status
-        if hasattr(record, "req_id"):
-            log_entry["req_id"] = record.req_id
-        if hasattr(record, "error"):
-            log_entry["error"] = record.error
+        record_fields = record.__dict__
+        for field in EXTRA_FIELDS:
+            if field in record_fields:
+                log_entry[field] = record_fields[field]
             
         # Add exception info if present
         if record.exc_info:
@@ -42,11 +71,21 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry)
 
 
+# Single formatter shared by every handler, so its per-second timestamp cache is shared too
+_JSON_FORMATTER = JSONFormatter()
+
+
 def setup_logging() -> None:
     """Setup JSON logging configuration."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    
+    level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    
     # Create logger
     logger = logging.getLogger("jyotish")
-    logger.setLevel(getattr(logging, settings.log_level.upper()))
+    logger.setLevel(level)
     
     # Remove existing handlers
     for handler in logger.handlers[:]:
@@ -54,13 +93,15 @@ def setup_logging() -> None:
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(JSONFormatter())
+    console_handler.setFormatter(_JSON_FORMATTER)
     logger.addHandler(console_handler)
     
     # Set as root logger
     logging.getLogger().handlers = []
     logging.getLogger().addHandler(console_handler)
-    logging.getLogger().setLevel(getattr(logging, settings.log_level.upper()))
+    logging.getLogger().setLevel(level)
+    
+    _logging_configured = True
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -71,9 +112,11 @@ def get_logger(name: str) -> logging.Logger:
 class RequestLogger:
     """Request logging context manager."""
     
+    __slots__ = ("route", "req_id", "start_time", "logger")
+    
     def __init__(self, route: str, req_id: str = None):
         self.route = route
-        self.req_id = req_id or str(uuid.uuid4())
+        self.req_id = req_id or f"{_PID_HEX}-{next(_REQ_COUNTER):x}"
         self.start_time = time.time()
         self.logger = get_logger("request")
         
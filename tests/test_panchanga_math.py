@@ -83,3 +83,17 @@ class TestPanchangaMath:
         assert tithi_result["tithi_number"] == 2  # 12 degrees ahead
         tithi_result = panchanga_service.calculate_tithi(180.0, 192.0)
         assert tithi_result["tithi_number"] == 2  # 12 degrees ahead
+    
+    def test_panchanga_range(self):
+        """Test multi-day panchanga matches single-day calculation."""
+        from datetime import datetime, timedelta
+        from app.services.swe import swe_service
+        
+        start_dt = datetime(2025, 8, 17, 6, 0, 0)
+        days = panchanga_service.calculate_panchanga_range(start_dt, 3)
+        
+        assert [day["date"] for day in days] == ["2025-08-17", "2025-08-18", "2025-08-19"]
+        for offset, day in enumerate(days):
+            sun_lon, moon_lon = swe_service.calculate_sun_moon_positions(start_dt + timedelta(days=offset))
+            assert day["tithi"] == panchanga_service._calculate_tithi(sun_lon, moon_lon)
+            assert day["nakshatra"]["longitude"] == pytest.approx(moon_lon)
@@ -0,0 +1,106 @@
+"""Place details cache tests."""
+
+import pytest
+
+from app.config import settings
+from app.routers import places
+
+
+class FakeResponse:
+    """Minimal stand-in for an httpx response from the Places API."""
+    
+    def __init__(self, place_id):
+        self.place_id = place_id
+    
+    def raise_for_status(self):
+        pass
+    
+    def json(self):
+        return {
+            "status": "OK",
+            "result": {
+                "place_id": self.place_id,
+                "name": f"Place {self.place_id}",
+                "formatted_address": "Somewhere",
+                "geometry": {"location": {"lat": 1.0, "lng": 2.0}},
+                "utc_offset": 0
+            }
+        }
+
+
+class FakeAsyncClient:
+    """Stand-in for httpx.AsyncClient that records every Places API call."""
+    
+    calls = []
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def get(self, url, params=None):
+        FakeAsyncClient.calls.append(params)
+        return FakeResponse(params["place_id"])
+
+
+class TestPlaceDetailsCache:
+    """Test the TTL/LRU cache in front of the place details endpoint."""
+    
+    @pytest.fixture(autouse=True)
+    def fake_places_api(self, monkeypatch):
+        """Route Places API calls to FakeAsyncClient and start from an empty cache."""
+        monkeypatch.setattr(settings, "google_maps_api_key", "test-key")
+        monkeypatch.setattr(places.httpx, "AsyncClient", FakeAsyncClient)
+        FakeAsyncClient.calls = []
+        places._details_cache.clear()
+        yield
+        places._details_cache.clear()
+    
+    async def details(self, place_id, sessiontoken=None):
+        """Call the endpoint with explicit query values."""
+        return await places.place_details(place_id, language="en", fields=None, sessiontoken=sessiontoken)
+    
+    async def test_hit_within_ttl(self):
+        """Test a repeated lookup within the TTL is served from cache."""
+        first = await self.details("abc")
+        second = await self.details("abc")
+        
+        assert second is first
+        assert len(FakeAsyncClient.calls) == 1
+    
+    async def test_expired_entry_is_refetched(self):
+        """Test an entry older than place_cache_ttl goes back to the API."""
+        first = await self.details("abc")
+        key = ("abc", "en", None)
+        details, fetched_at = places._details_cache[key]
+        places._details_cache[key] = (details, fetched_at - settings.place_cache_ttl - 1)
+        
+        second = await self.details("abc")
+        
+        assert second is not first
+        assert len(FakeAsyncClient.calls) == 2
+    
+    async def test_evicts_least_recently_used(self, monkeypatch):
+        """Test inserting past PLACE_DETAILS_CACHE_SIZE evicts the least recently used entry."""
+        monkeypatch.setattr(places, "PLACE_DETAILS_CACHE_SIZE", 2)
+        await self.details("a")
+        await self.details("b")
+        await self.details("a")  # Hit: "b" becomes least recently used
+        await self.details("c")
+        
+        assert list(places._details_cache) == [("a", "en", None), ("c", "en", None)]
+        assert len(FakeAsyncClient.calls) == 3
+    
+    async def test_sessiontoken_bypasses_cache(self):
+        """Test requests with a session token always reach the API and are not cached."""
+        await self.details("abc")
+        await self.details("abc", sessiontoken="token-1")
+        await self.details("xyz", sessiontoken="token-2")
+        
+        assert len(FakeAsyncClient.calls) == 3
+        assert FakeAsyncClient.calls[1]["sessiontoken"] == "token-1"
+        assert list(places._details_cache) == [("abc", "en", None)]
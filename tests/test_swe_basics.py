@@ -1,8 +1,8 @@
 """Basic Swiss Ephemeris tests."""
 
 import pytest
-from datetime import datetime
-from app.services.swe import swe_service
+from datetime import datetime, timedelta, timezone
+from app.services.swe import swe_service, _angular_indices
 
 
 class TestSwissEphemeris:
@@ -64,6 +64,26 @@ class TestSwissEphemeris:
         assert nakshatra_number == 1
         assert pada == 4  # 13.333 is in the 4th pada of Ashwini
     
+    def test_angular_indices(self):
+        """Test combined rasi/nakshatra/pada index calculation."""
+        assert _angular_indices(0.0) == (0, 0, 0)
+        assert _angular_indices(30.0) == (1, 2, 1)  # Krittika pada 2 starts Vrishabha
+        assert _angular_indices(40.0) == (1, 3, 0)  # Rohini starts at 40°
+        assert _angular_indices(359.999) == (11, 26, 3)
+        assert _angular_indices(360.0) == (0, 0, 0)
+        assert _angular_indices(-1.0) == (11, 26, 3)  # Wraps to 359°: Meena, Revati pada 4
+        assert _angular_indices(-1e-20) == (0, 0, 0)
+    
+    def test_julian_day_from_aware_datetime(self):
+        """Test tz-aware datetimes convert to the same Julian Day as naive UT."""
+        naive = datetime(2025, 8, 17, 12, 34, 56)
+        aware = naive.replace(tzinfo=timezone.utc)
+        assert swe_service._get_jd(aware) == pytest.approx(swe_service._get_jd(naive), abs=1e-9)
+        
+        # Non-UTC offsets are converted to UT
+        local = (aware + timedelta(hours=2)).replace(tzinfo=timezone(timedelta(hours=2)))
+        assert swe_service._get_jd(local) == pytest.approx(swe_service._get_jd(naive), abs=1e-9)
+    
     def test_tithi_calculation(self):
         """Test tithi calculation."""
         # Test same position